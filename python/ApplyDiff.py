@@ -4,7 +4,7 @@ Apply a DIFF file to a binary file.
 
 A DIFF file can be generated from IDA Pro for example or the output of "FC.EXE /B file1.bin file2.bin
 """
-import os, sys, re, getopt
+import os, sys, re, argparse, itertools, mmap
 
 # TODO:
 # -- make as an IDA plugin
@@ -13,100 +13,107 @@ import os, sys, re, getopt
 
 #import code
 
-def apply_diff(diff_file, bin_file, verify):
-    # Get the binary file size
-    try:
-        bin_size = os.path.getsize(bin_file)
-    except:
-        return (False, "Binary file '%s' not found!" % bin_file)
+# Matches a "<offset>: <original> <new>" patch line of the diff file
+DIFF_RE = re.compile(rb'^[ \t]*([0-9a-f]+): ([0-9a-f]{2}) ([0-9a-f]{2})[ \t\r]*$', re.IGNORECASE | re.MULTILINE)
 
-    # Open the binary file for updates
+def group_runs(patches):
+    """
+    Group the {offset: (original, new)} patches into runs of consecutive offsets.
+    Yields (start_offset, original_bytes, new_bytes) for each run.
+    """
+    items = sorted(patches.items())
+    for _, run in itertools.groupby(enumerate(items), lambda x: x[1][0] - x[0]):
+        run = [item for _, item in run]
+        yield (run[0][0], bytes(o for _, (o, _) in run), bytes(n for _, (_, n) in run))
+
+def apply_diff(diff_file, bin_file, verify):
+    # Open the binary file for updates and get its size
     try:
         bf = open(bin_file, 'r+b')
-    except:
+    except FileNotFoundError:
+        return (False, "Binary file '%s' not found!" % bin_file)
+    except OSError:
         return (False, "Binary file '%s' could not be open for updates" % bin_file)
 
-    # Compile the regular expression
-    diff_re = re.compile(r'^([0-9a-f]+): ([0-9a-f]{2}) ([0-9a-f]{2})$', re.IGNORECASE)
+    bin_size = os.fstat(bf.fileno()).st_size
 
-    # Open the diff file
+    # Read the whole diff file
     try:
-        df = open(diff_file, 'r')
-    except:
+        with open(diff_file, 'rb') as df:
+            data = df.read()
+    except OSError:
         bf.close()
         return (False, "Diff file '%s' could not be open for reading" % diff_file)
 
-    # Read the diff file
+    # Parse the diff file, decoding the original/new byte columns in bulk
+    entries = DIFF_RE.findall(data)
+    offsets = [int(off, 16) for (off, _, _) in entries]
+    origs = bytes.fromhex(b''.join(o for (_, o, _) in entries).decode('ascii'))
+    news = bytes.fromhex(b''.join(n for (_, _, n) in entries).decode('ascii'))
+
+    # Check the offsets against the file size
+    if offsets and max(offsets) >= bin_size:
+        bf.close()
+        i = next(i for (i, seek_pos) in enumerate(offsets) if seek_pos >= bin_size)
+        m = next(itertools.islice(DIFF_RE.finditer(data), i, None))
+        line_no = data.count(b'\n', 0, m.start()) + 1
+        return (False, "At line %d, seek position 0x%X in diff file is past the end of the file!" % (line_no, offsets[i]))
+
+    # {offset: (original, new)}
+    patches = dict(zip(offsets, zip(origs, news)))
+
+    if not patches:
+        bf.close()
+        return (True, "Applied 0 patche(s), with 0 warning(s).")
+
+    # Map the binary file and apply the patches, one slice per run of consecutive offsets
     count = 0
-    nwarning = 0
+    warnings = []
     try:
-        for (lino_no, line) in enumerate(df, start=1):
-            m = diff_re.match(line.strip())
-            if not m:
-                continue
-
-            seek_pos = int(m.group(1), 16)
-            if seek_pos > bin_size:
-                raise Exception("Seek position 0x%X in diff file is greater than the file size!" % (seek_pos))
+        mm = mmap.mmap(bf.fileno(), 0, access=mmap.ACCESS_WRITE)
+    except (OSError, ValueError) as e:
+        bf.close()
+        return (False, "Binary file '%s' could not be mapped for updates: %s" % (bin_file, str(e)))
 
+    try:
+        for (seek_pos, orig, new) in group_runs(patches):
+            end_pos = seek_pos + len(new)
             if verify:
-                bf.seek(seek_pos)
-                v = ord(bf.read(1))
-                o = int(m.group(2), 16)
-
-                if v != o:
-                    print("WARNING: verification failed. Original byte %02X is expected, %02X found instead. Skipping." % (o, v))
-                    nwarning += 1
+                cur = mm[seek_pos:end_pos]
+                if cur != orig:
+                    for (o, v) in zip(orig, cur):
+                        if v != o:
+                            warnings.append("WARNING: verification failed. Original byte %02X is expected, %02X found instead. Skipping.\n" % (o, v))
 
+            mm[seek_pos:end_pos] = new
+            count += len(new)
 
-            bf.seek(seek_pos)
-            v = int(m.group(3), 16)
-            bf.write(bytes([v]))
-            count += 1
+        mm.flush()
 
-        ok, msg = True, (f"Applied {count} patche(s), with {nwarning} warning(s).")
+        ok, msg = True, (f"Applied {count} patche(s), with {len(warnings)} warning(s).")
 
     except Exception as e:
-        ok, msg = False, "At line %d, seek %08X, exception occured during patching: %s" % (line_no, seek_pos, str(e))
+        ok, msg = False, "At seek %08X, exception occured during patching: %s" % (seek_pos, str(e))
         #code.interact(local=locals())
 
+    mm.close()
     bf.close()
-    df.close()
+
+    # Report the verification warnings in one write
+    sys.stdout.write(''.join(warnings))
 
     return (ok, msg)
 
 # --------------------------------------------------------------------------------------------
-def show_help(err_msg = None):
-    if err_msg is not None:
-        print("Error parsing arguments: %s " % err_msg)
-
-    print('%s -i <diff inputfile> -o <bin outputfile> [-f (force)]' % os.path.basename(sys.argv[0]))
+def main(argv = None):
+    parser = argparse.ArgumentParser(description="Apply a DIFF file to a binary file.")
+    parser.add_argument("-i", "--ifile", dest="diff_file", required=True, help="The diff input file.")
+    parser.add_argument("-o", "--ofile", dest="bin_file", required=True, help="The binary file to patch.")
+    parser.add_argument("-f", dest="force", action="store_true", help="Force: do not verify the original bytes.")
 
+    args = parser.parse_args(argv)
 
-# --------------------------------------------------------------------------------------------
-def main(argv):
-    verify = True
-    bin_file = diff_file = None
-
-    try:
-        opts, args = getopt.getopt(argv, "fi:o:",["ifile=","ofile="])
-    except getopt.GetoptError as e:
-        show_help(str(e))
-        return
-
-    for opt, arg in opts:
-        if opt == '-f':
-            verify = False
-        elif opt in ("-i", "--ifile"):
-            diff_file = arg
-        elif opt in ("-o", "--ofile"):
-            bin_file = arg
-
-    if bin_file is None or diff_file is None:
-        show_help()
-        return
-
-    ok, msg = apply_diff(diff_file, bin_file, verify)
+    ok, msg = apply_diff(args.diff_file, args.bin_file, not args.force)
     if not ok:
         print("Error: %s" % msg)
     else:
@@ -5,6 +5,12 @@ import sys, os
 # Optional maximum bytes per line
 MAX_LINE = 4
 
+# Number of lines formatted per write to stdout
+BATCH_LINES = 1024
+
+# Emitted in front of each byte's hex value
+EMIT_PREFIX = '__asm __emit 0x'
+
 def main():
     # Check if the filename exists
     if len(sys.argv) < 2 or not os.path.exists(sys.argv[1]):
@@ -16,16 +22,21 @@ def main():
         d = f.read()
 
     # Optionally update the items per line
-    if len(sys.argv) > 2:
-        MAX_LINE = int(sys.argv[2]) 
+    items_perline = int(sys.argv[2]) if len(sys.argv) > 2 else MAX_LINE
+
+    # Stream the lines; each line's bytes are hex-formatted by a single bytes.hex() call
+    out = sys.stdout.buffer
+    sep = b''
+    batch = items_perline * BATCH_LINES
+    for start in range(0, len(d), batch):
+        lines = [EMIT_PREFIX + d[i : i + items_perline].hex(' ').replace(' ', ' ' + EMIT_PREFIX)
+                 for i in range(start, min(start + batch, len(d)), items_perline)]
 
-    # Emit the lines
-    lines = []
-    while len(d) > 0:
-        p, d = d[0 : MAX_LINE], d[MAX_LINE:]
-        lines.append(' '.join(["__asm __emit 0x%02x" % ord(x) for x in p]))
+        out.write(sep + ' \\\n'.join(lines).encode('ascii'))
+        sep = b' \\\n'
 
-    print(' \\\n'.join(lines))
+    out.write(b'\n')
+    out.flush()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -9,6 +9,8 @@ from typing import Tuple
 import os
 import argparse
 import shutil
+import re
+import functools
 
 GENERATOR_NAME = "dll2proj"
 GENERATOR_VERSION = "1.0"
@@ -25,9 +27,13 @@ class DLLFile:
     def __init__(self, dll_path):
         self.dll_path = dll_path
         self.dll_name = os.path.basename(dll_path)
-        self.pe = pefile.PE(dll_path)
+        # Only the headers and the export directory are needed
+        self.pe = pefile.PE(dll_path, fast_load=True)
+        self.pe.parse_data_directories(directories=[pefile.DIRECTORY_ENTRY['IMAGE_DIRECTORY_ENTRY_EXPORT']])
         self.exports = self.extract_exports()
         self.machine = self.extract_machine()
+        # Release the file mapping now that everything has been extracted
+        self.pe.close()
 
 
     def extract_machine(self) -> str:
@@ -46,21 +52,24 @@ class DLLFile:
             return []
 
         exports = []
-        aliases = {}
         for exp in self.pe.DIRECTORY_ENTRY_EXPORT.symbols:
             if exp.name is not None:
                 symbol = exp.name.decode('utf-8')
                 # Check for mangled names (simplified check)
                 if '@' in symbol:
-                    alias = f"_{symbol.replace('@', '_at_')}"
-                    aliases[symbol] = alias
-                    exports.append(f"{alias}={symbol}")
+                    exports.append(f"_{symbol.replace('@', '_at_')}={symbol}")
                 else:
                     exports.append(symbol)
 
         return exports
         
 
+@functools.lru_cache(maxsize=None)
+def load_template(template_file) -> str:
+    """Reads a template file, caching its contents across generated projects."""
+    with open(template_file, "r") as template:
+        return template.read()
+
 def create_def_file(dll_path) -> Tuple[str, DLLFile]:
     """Creates a DEF file for the given DLL using pefile."""
     dll_name = os.path.basename(dll_path)
@@ -73,11 +82,10 @@ def create_def_file(dll_path) -> Tuple[str, DLLFile]:
         return (f'Failed to load DLL: {e!s}', None)
 
     # Write the DEF file
+    lines = [f"LIBRARY {os.path.splitext(dll_name)[0]}\n", "EXPORTS\n"]
+    lines.extend(f"    {symbol}\n" for symbol in dllfile.exports)
     with open(def_filename, 'w') as def_file:
-        def_file.write(f"LIBRARY {os.path.splitext(dll_name)[0]}\n")
-        def_file.write("EXPORTS\n")
-        for symbol in dllfile.exports:
-            def_file.write(f"    {symbol}\n")
+        def_file.writelines(lines)
 
     return def_filename, dllfile
 
@@ -92,16 +100,23 @@ def generate_mock_project(dll_path, output_dir):
         print(err := def_filename)
         return
 
+    # Build the per-export snippets in a single pass over the exports
+    function_calls, function_declarations, dummy_function_definitions = [], [], []
+    for func in dllfile.exports:
+        function_calls.append(f"    {func}();")
+        function_declarations.append(f"EXPORT_IT({func});")
+        dummy_function_definitions.append(f"void {func}(void) {{ }}")
+
     # Define the expansion dictionary
     expansion_dict = {
         "project_name": os.path.splitext(dllfile.dll_name)[0],
         "dll_name": dllfile.dll_name,
         "dll_machine": dllfile.machine,
-        "function_calls": "\n".join([f"    {func}();" for func in dllfile.exports]),
+        "function_calls": "\n".join(function_calls),
         # usually goes to 'mylib.h'
-        "function_declarations": "\n".join([f"EXPORT_IT({func});" for func in dllfile.exports]),
+        "function_declarations": "\n".join(function_declarations),
         # usually goes to 'mylib.cpp'
-        "dummy_function_definitions": "\n".join([f"void {func}(void) {{ }}" for func in dllfile.exports]),
+        "dummy_function_definitions": "\n".join(dummy_function_definitions),
         #// Generated on {generation_date} with {generator_name} {generator_version}
         "generation_date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "generator_name": GENERATOR_NAME,
@@ -109,15 +124,15 @@ def generate_mock_project(dll_path, output_dir):
         "cmake_arch": "x64" if dllfile.machine == "X64" else "Win32"    
     }
 
+    # Match any "{key}" of the expansion dictionary so each template is expanded in a single pass
+    expansion_re = re.compile("|".join(re.escape(f"{{{key}}}") for key in expansion_dict))
+
     # Generate files using the expansion dictionary
     for template_file, output_file in TEMPLATE_FILES.items():
         template_file = os.path.join(os.path.dirname(__file__), template_file)
-        with open(template_file, "r") as template, \
-             open(os.path.join(output_dir, output_file), "w") as output:
-            
-            template_content = template.read()
-            for key, value in expansion_dict.items():
-                template_content = template_content.replace(f"{{{key}}}", value)        
+        with open(os.path.join(output_dir, output_file), "w") as output:
+            template_content = load_template(template_file)
+            template_content = expansion_re.sub(lambda m: expansion_dict[m.group(0)[1:-1]], template_content)
             output.write(template_content)
     
     # Move the DEF file to the output directory, overwriting if it exists
@@ -1,20 +1,55 @@
+import sys
 import json
 import argparse
 
+# Use orjson for faster parsing when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Number of buffered lines before they are written out
+FLUSH_LINES = 4096
+
 def print_tree(node, prefix='/'):
-    if isinstance(node, dict):
-        for k, v in node.items():
-            print(f"{prefix}{k}/")
-            print_tree(v, prefix + k + '/')
-    elif isinstance(node, list):
-        for i, item in enumerate(node):
-            print(f"{prefix}[{i}]/")
-            print_tree(item, prefix)
+    # Walk the tree with an explicit stack of (line, node, prefix), children pushed in reverse
+    out = []
+    stack = [(None, node, prefix)]
+    while stack:
+        line, node, prefix = stack.pop()
+        if line is not None:
+            out.append(line)
+            if len(out) >= FLUSH_LINES:
+                sys.stdout.write(''.join(out))
+                out.clear()
+
+        if isinstance(node, dict):
+            children = []
+            for k, v in node.items():
+                path = f"{prefix}{k}/"
+                children.append((path + '\n', v, path))
+            stack.extend(reversed(children))
+        elif isinstance(node, list):
+            stack.extend(reversed([(f"{prefix}[{i}]/\n", item, prefix) for i, item in enumerate(node)]))
+
+    sys.stdout.write(''.join(out))
+
+def load_json(file_path):
+    if orjson is None:
+        with open(file_path, 'r') as file:
+            return json.load(file)
+
+    with open(file_path, 'rb') as file:
+        raw = file.read()
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # orjson is stricter (e.g. NaN, big integers): let the standard module decide
+        return json.loads(raw)
 
 def parse_json_file(file_path):
-    with open(file_path, 'r') as file:
-        data = json.load(file)
-        print_tree(data)
+    data = load_json(file_path)
+    print_tree(data)
 
 def main():
     parser = argparse.ArgumentParser(description='Process a JSON file.')
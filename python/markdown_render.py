@@ -1,11 +1,11 @@
 # pip install markdown2 pygments
 
 import http.server
-import socketserver
 import markdown2
 import os
 import requests
 import argparse
+import functools
 
 # Default port
 DEFAULT_PORT = 8000
@@ -23,6 +23,13 @@ CSS_STYLES = """
 </style>
 """
 
+# Sent ahead of every rendered page
+CSS_STYLES_BYTES = (CSS_STYLES + "\n").encode()
+
+# Shared session so GitHub API calls reuse the HTTPS connection
+GITHUB_SESSION = requests.Session()
+GITHUB_SESSION.headers['Accept'] = 'application/vnd.github.v3+json'
+
 def render_markdown_to_html_github(markdown_content):
     # GitHub API URL for rendering Markdown
     url = 'https://api.github.com/markdown'
@@ -34,7 +41,11 @@ def render_markdown_to_html_github(markdown_content):
     }
 
     # Make the API request
-    response = requests.post(url, json=data)
+    try:
+        response = GITHUB_SESSION.post(url, json=data, timeout=10)
+    except requests.RequestException as e:
+        print(f"Error: {e}")
+        return None
 
     # Check for successful response
     if response.status_code == 200:
@@ -43,24 +54,40 @@ def render_markdown_to_html_github(markdown_content):
         print(f"Error: {response.status_code}")
         return None
 
+@functools.lru_cache(maxsize=128)
+def render_markdown_file(file_path, mtime_ns, use_github):
+    """Renders a Markdown file to encoded HTML (without the styles); cached per (path, modification time)."""
+    with open(file_path, 'r') as file:
+        markdown_text = file.read()
+
+    if use_github:
+        html_content = render_markdown_to_html_github(markdown_text)
+        if html_content is None:
+            # Raising keeps the failure out of the cache
+            raise RuntimeError("GitHub API rendering failed")
+    else:
+        html_content = markdown2.markdown(markdown_text, extras=["fenced-code-blocks", "code-friendly", "tables", "pygments"])
+
+    return html_content.encode()
+
 def main(use_github, port):
     class MarkdownHTTPHandler(http.server.SimpleHTTPRequestHandler):
         def do_GET(self):
             file_path = self.path.strip("/")
             if file_path.endswith(".md"):
                 if os.path.isfile(file_path):
-                    with open(file_path, 'r') as file:
-                        markdown_text = file.read()
-                        if use_github:
-                            html_content = render_markdown_to_html_github(markdown_text)
-                        else:
-                            html_content = markdown2.markdown(markdown_text, extras=["fenced-code-blocks", "code-friendly", "tables", "pygments"])
-                        full_html_content = f"{CSS_STYLES}\n{html_content}"
+                    try:
+                        html_content = render_markdown_file(file_path, os.stat(file_path).st_mtime_ns, use_github)
+                    except RuntimeError as e:
+                        self.send_error(502, str(e))
+                        return
 
                     self.send_response(200)
                     self.send_header('Content-type', 'text/html')
+                    self.send_header('Content-Length', str(len(CSS_STYLES_BYTES) + len(html_content)))
                     self.end_headers()
-                    self.wfile.write(full_html_content.encode())
+                    self.wfile.write(CSS_STYLES_BYTES)
+                    self.wfile.write(html_content)
                 else:
                     self.send_error(404, f"File not found: {self.path}")
             else:
@@ -69,7 +96,8 @@ def main(use_github, port):
     if use_github:
         print("Using GitHub API for rendering")
 
-    with socketserver.TCPServer(("", port), MarkdownHTTPHandler) as httpd:
+    # Threaded, so a slow render (e.g. a GitHub API call) does not block other requests
+    with http.server.ThreadingHTTPServer(("", port), MarkdownHTTPHandler) as httpd:
         print(f"Serving at port {port}")
         httpd.serve_forever()
 
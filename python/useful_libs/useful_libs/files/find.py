@@ -2,6 +2,7 @@
 # Files search utility
 
 import os
+import re
 import fnmatch
 from datetime import datetime
 from typing import Optional, Tuple
@@ -19,17 +20,32 @@ def find_latest_file_date(base_folder: str, filter: str = '*.*') -> Optional[Tup
         Optional[Tuple[datetime, str]]: A tuple of the date of the latest file and its path,
         or None if no matching files are found.
     """
-    latest_date = None
+    latest_mtime = None
     latest_file = ''
-    
-    for root, _, files in os.walk(base_folder):
-        for file in fnmatch.filter(files, filter):
-            file_path = os.path.join(root, file)
-            file_mtime = os.path.getmtime(file_path)
-            file_date = datetime.fromtimestamp(file_mtime)
-            
-            if latest_date is None or file_date > latest_date:
-                latest_date = file_date
-                latest_file = file_path
-                
-    return (latest_date, latest_file) if latest_date else (None, None)
+
+    # Compile the pattern once (with the same case handling as fnmatch.fnmatch)
+    match = re.compile(fnmatch.translate(os.path.normcase(filter))).match
+
+    # Top-down walk in os.walk() order, taking each mtime from its directory entry
+    dirs = [base_folder]
+    while dirs:
+        try:
+            with os.scandir(dirs.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            elif match(os.path.normcase(entry.name)):
+                file_mtime = entry.stat().st_mtime
+                if latest_mtime is None or file_mtime > latest_mtime:
+                    latest_mtime = file_mtime
+                    latest_file = entry.path
+
+        dirs.extend(reversed(subdirs))
+
+    return (datetime.fromtimestamp(latest_mtime), latest_file) if latest_mtime is not None else (None, None)
@@ -9,32 +9,49 @@ class MarkdownHeading:
         self.title: str = title
         self.contents: list[str] = []
         self.subheadings: list[MarkdownHeading] = []
+        self._subheadings_by_title = None
 
     def add_subheading(self, subheading):
         self.subheadings.append(subheading)
+        self._subheadings_by_title = None
+
+    def get_subheading(self, title):
+        # Built on first lookup; the last subheading with a given title wins
+        if self._subheadings_by_title is None:
+            self._subheadings_by_title = {h.title: h for h in self.subheadings}
+        return self._subheadings_by_title.get(title)
+
+    def to_dict(self):
+        result = {'title': self.title, 'contents': self.contents}
+        for subheading in self.subheadings:
+            result[subheading.title] = subheading.to_dict()
+        return result
 
     def __str__(self):
         return f'{"#" * self.level} {self.title}'
 
 class MarkdownDict:
-    def __init__(self, data):
-        self.data = data
+    """Dictionary-like view over a parsed MarkdownHeading tree."""
+    def __init__(self, root):
+        self.root: MarkdownHeading = root
 
     def __getitem__(self, key):
-        return self.data.get(key)
+        heading = self.root.get_subheading(key)
+        if heading is not None:
+            return heading.to_dict()
+        if key == 'title':
+            return self.root.title
+        if key == 'contents':
+            return self.root.contents
+        return None
 
     def get_val(self, path, default=None, check_title=False):
-        d = self.data
+        heading = self.root
         for k in path.split('.'):
-            d = d.get(k)
-            if not d:
-                return default
-            if d.get('title', '') != k:
+            heading = heading.get_subheading(k)
+            if heading is None:
                 return default
-        v = d.get('contents')
-        if v is None:
-            return default
-        return '\n'.join(v)
+        return '\n'.join(heading.contents)
 
 def parse_markdown(text):
     lines = text.split('\n')
@@ -43,27 +60,24 @@ def parse_markdown(text):
     stack.append(root)
 
     for line in lines:
-        if line.startswith('#'):
-            level = len(line.split(' ')[0])
-            title = line[level + 1:]
-            heading = MarkdownHeading(level, title)
-
-            while stack and stack[-1].level >= level:
-                stack.pop()
-            
-            stack[-1].add_subheading(heading)
-            stack.append(heading)
-        else:
-            if stack:
-                stack[-1].contents.append(line)
-
-    def build_dict(heading):
-        result = {'title': heading.title, 'contents': heading.contents}
-        for subheading in heading.subheadings:
-            result[subheading.title] = build_dict(subheading)
-        return result
+        if not line.startswith('#'):
+            stack[-1].contents.append(line)
+            continue
+
+        # The heading marker is everything up to the first space
+        level = line.find(' ')
+        if level < 0:
+            level = len(line)
+        title = line[level + 1:]
+        heading = MarkdownHeading(level, title)
+
+        while stack[-1].level >= level:
+            stack.pop()
+
+        stack[-1].add_subheading(heading)
+        stack.append(heading)
 
-    return root.subheadings, MarkdownDict(build_dict(root))
+    return root.subheadings, MarkdownDict(root)
 
 def print_headings(heading, indent=0):
     print(' ' * indent + f'Heading: {heading}')